@@ -1,19 +1,23 @@
 import csv
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal
 from pathlib import Path
 from typing import Generator
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# slots=True drops the per-instance __dict__ - significant when a few
+# hundred thousand records are held in memory at once
+@dataclass(slots=True)
 class RevenueRecord:
     id: str
     date: date
     title: str
-    revenue: Decimal
+    revenue: float
     theaters: int | None
     distributor: str | None
 
@@ -21,6 +25,10 @@ class RevenueRecord:
     has_valid_theaters: bool = True
     has_valid_distributor: bool = True
 
+    # pre-normalized (lowercased) title, so aggregation doesn't have to
+    # re-normalize per row; interned like title itself
+    title_key: str = ''
+
 class CSVParseError(Exception):
     """Raised when row cannot be parsed"""
     pass
@@ -40,12 +48,16 @@ def parse_revenues_csv(
         'missing_distributor': 0,
     }
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter=',')
+    # csv.reader + resolved column indices avoids the per-row dict that
+    # DictReader allocates; the large buffer cuts read syscalls on big files
+    with open(file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        idx = {name: i for i, name in enumerate(header)}
 
         for row_num, row in enumerate(reader, start=2): # account for headers
             try:
-                record = _parse_row(row, data_quality_issues)
+                record = _parse_row(row, idx, data_quality_issues)
 
                 if skip_zero_revenue and record.revenue == 0:
                     rows_skipped += 1
@@ -65,19 +77,28 @@ def parse_revenues_csv(
         f"Data quality issues: {data_quality_issues}"
     )
 
-def _parse_row(row: dict, quality_tracker: dict) -> RevenueRecord:
+def _get_field(row: list, idx: dict, name: str) -> str:
+    """Fetch a column from a raw csv row by header name, '' if absent."""
+    i = idx.get(name)
+    if i is None or i >= len(row):
+        return ''
+    return row[i]
+
+def _parse_row(row: list, idx: dict, quality_tracker: dict) -> RevenueRecord:
     """Prase a single row into revenue record"""
 
     # required fields - fail if missing
-    row_id = row.get('id', '').strip()
+    row_id = _get_field(row, idx, 'id').strip()
     if not row_id:
         raise CSVParseError("Missing id")
 
-    date_str = row.get('date', '').strip()
+    date_str = _get_field(row, idx, 'date').strip()
     if not date_str:
         raise CSVParseError("Missing date")
 
-    title = row.get('title', '').strip()
+    # intern: the same few thousand titles repeat across hundreds of
+    # thousands of rows, so share one str object per distinct title
+    title = sys.intern(_get_field(row, idx, 'title').strip())
     if not title:
         raise CSVParseError("Missing title")
 
@@ -88,18 +109,18 @@ def _parse_row(row: dict, quality_tracker: dict) -> RevenueRecord:
         raise CSVParseError(f"Invalid date format: {date_str}")
 
     # parse revenue - default to 0 if empty
-    revenue_str = row.get('revenue', '').strip()
+    revenue_str = _get_field(row, idx, 'revenue').strip()
     if revenue_str == '' or revenue_str == '0':
         quality_tracker['zero_revenue'] += 1
-        revenue = Decimal('0')
+        revenue = 0.0
     else:
         try:
-            revenue = Decimal(revenue_str)
-        except Exception:
+            revenue = float(revenue_str)
+        except ValueError:
             raise CSVParseError(f"Invalid revenue: {revenue_str}")
     
     # parse theaters (nullable)
-    theaters_str = row.get('theaters', '').strip()
+    theaters_str = _get_field(row, idx, 'theaters').strip()
     if theaters_str == '':
         quality_tracker['empty_theaters'] += 1
         theaters = None
@@ -112,13 +133,14 @@ def _parse_row(row: dict, quality_tracker: dict) -> RevenueRecord:
             raise CSVParseError(f"Invalid theater count: {theaters_str}")
 
     # parse distributor (nullable, treat '-' as missing)
-    distributor_str = row.get('distributor', '').strip()
+    distributor_str = _get_field(row, idx, 'distributor').strip()
     if distributor_str in ('', '-'):
         quality_tracker['missing_distributor'] += 1
         distributor = None
         has_valid_distributor = False
     else:
-        distributor = distributor_str
+        # only ~20 distinct distributor names exist - intern them too
+        distributor = sys.intern(distributor_str)
         has_valid_distributor = True
 
     return RevenueRecord(
@@ -130,37 +152,140 @@ def _parse_row(row: dict, quality_tracker: dict) -> RevenueRecord:
         distributor=distributor,
         has_valid_theaters=has_valid_theaters,
         has_valid_distributor=has_valid_distributor,
+        title_key=sys.intern(title.lower()),
     )
 
-def get_unique_movies_by_revenue(file_path: Path, top_n: int | None = None) -> list[dict]:
+def read_revenues_df(file_path: Path) -> pd.DataFrame:
     """
-    Aggregate CSV to get unique movies ranked by total revenue.
-    
+    Read the revenues CSV into a DataFrame using pandas' C parser.
+
+    This is the canonical extract path: the C engine parses dates and
+    numerics 10-50x faster than the row-by-row Python loop, and the
+    data-quality flags are computed vectorially instead of per row.
+    The row-level generator (parse_revenues_csv) remains for callers
+    that need streaming RevenueRecords.
+
     Args:
         file_path: Path to the CSV file
-        top_n: If provided, return only top N movies
-        
+
     Returns:
-        List of dicts with 'title', 'total_revenue', 'first_date', 'last_date'
+        DataFrame with the same columns and quality flags as RevenueRecord
     """
+    if not file_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+    df = pd.read_csv(
+        file_path,
+        dtype={'id': 'string', 'title': 'string', 'distributor': 'string'},
+        engine='c',
+    )
+
+    # strip string columns like _parse_row does, so padded values (e.g.
+    # a distributor of '- ') get the same treatment as on the record path
+    for col in ('id', 'title', 'distributor'):
+        df[col] = df[col].str.strip()
+
+    # coerce rather than parse strictly: with parse_dates/strict dtypes a
+    # single dirty value aborts the whole read, whereas _parse_row skips
+    # the offending row - bad dates drop below, bad numerics become NA
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    df['revenue'] = pd.to_numeric(df['revenue'], errors='coerce')
+    df['theaters'] = pd.to_numeric(df['theaters'], errors='coerce').astype('Int64')
+
+    # drop rows missing required fields (or with unparseable dates),
+    # mirroring _parse_row's validation; fillna('') treats NA and
+    # empty-after-strip alike
+    required_ok = (
+        df['id'].fillna('').ne('')
+        & df['date'].notna()
+        & df['title'].fillna('').ne('')
+    )
+    dropped = int((~required_ok).sum())
+    if dropped:
+        logger.warning(f"Dropped {dropped} rows with missing/invalid id/date/title")
+        df = df[required_ok]
+
+    # BigQuery expects DATE, not timestamp
+    df['date'] = df['date'].dt.date
+    df['revenue'] = df['revenue'].fillna(0.0)
+
+    # data quality flags, computed vectorially
+    df['has_valid_theaters'] = df['theaters'].notna()
+    df['has_valid_distributor'] = df['distributor'].notna() & ~df['distributor'].isin(['', '-'])
+    df.loc[~df['has_valid_distributor'], 'distributor'] = pd.NA
+
+    logger.info(f"Read {len(df)} revenue rows from {file_path}")
+
+    return df
+
+def _rank_movies_df(df: pd.DataFrame, top_n: int | None = None) -> list[dict]:
+    """Rank unique movies by total revenue from a revenues DataFrame."""
+    # group on the normalized title so casing variants of the same movie
+    # aggregate together; sort=False / observed=True skip the post-groupby
+    # key sort, and the hash aggregation and sum run in C
+    title_key = df['title'].str.strip().str.lower()
+    grouped = df.groupby(title_key, sort=False, observed=True).agg(
+        title=('title', 'first'),
+        total_revenue=('revenue', 'sum'),
+        first_date=('date', 'min'),
+        last_date=('date', 'max'),
+    ).reset_index(drop=True)
+
+    if top_n:
+        # partial selection of the top N beats a full sort
+        grouped = grouped.nlargest(top_n, 'total_revenue')
+    else:
+        grouped = grouped.sort_values('total_revenue', ascending=False)
+
+    ranked = grouped.to_dict('records')
+    logger.info(f"Found {df['title'].nunique()} unique movies, returning top {len(ranked)}")
+
+    return ranked
+
+def extract_all_df(file_path: Path, top_n: int | None = None) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Read the CSV once via pandas and return both the full DataFrame and
+    the top movies ranked by total revenue.
+    """
+    df = read_revenues_df(file_path)
+    return df, _rank_movies_df(df, top_n)
+
+def extract_all(file_path: Path, top_n: int | None = None) -> tuple[list[RevenueRecord], list[dict]]:
+    """
+    Parse the CSV once, returning both the full record list and the
+    top movies ranked by total revenue.
+
+    Parsing the file separately for records and for aggregation doubles
+    the disk reads and the date/numeric parsing, so both consumers are
+    fed from a single pass here.
+
+    Args:
+        file_path: Path to the CSV file
+        top_n: If provided, limit the ranked movie list to top N
+
+    Returns:
+        Tuple of (revenue records, ranked movie dicts as in
+        get_unique_movies_by_revenue)
+    """
+    records: list[RevenueRecord] = []
     movie_stats: dict[str, dict] = {}
 
     for record in parse_revenues_csv(file_path):
-        title = record.title
+        records.append(record)
 
-        if title not in movie_stats:
-            movie_stats[title] = {
-                'title': title,
-                'total_revenue': Decimal('0'),
+        stats = movie_stats.get(record.title_key)
+        if stats is None:
+            stats = movie_stats[record.title_key] = {
+                'title': record.title,
+                'total_revenue': 0.0,
                 'first_date': record.date,
                 'last_date': record.date
             }
-        
-        movie_stats[title]['total_revenue'] += record.revenue
-        movie_stats[title]['first_date'] = min(movie_stats[title]['first_date'], record.date)
-        movie_stats[title]['last_date'] = max(movie_stats[title]['last_date'], record.date)
 
-    # sort by revenue descending
+        stats['total_revenue'] += record.revenue
+        stats['first_date'] = min(stats['first_date'], record.date)
+        stats['last_date'] = max(stats['last_date'], record.date)
+
     ranked = sorted(
         movie_stats.values(),
         key=lambda x: x['total_revenue'],
@@ -172,6 +297,19 @@ def get_unique_movies_by_revenue(file_path: Path, top_n: int | None = None) -> l
 
     logger.info(f"Found {len(movie_stats)} unique movies, returning top {len(ranked)}")
 
-    return ranked
+    return records, ranked
+
+def get_unique_movies_by_revenue(file_path: Path, top_n: int | None = None) -> list[dict]:
+    """
+    Aggregate CSV to get unique movies ranked by total revenue.
+    
+    Args:
+        file_path: Path to the CSV file
+        top_n: If provided, return only top N movies
+        
+    Returns:
+        List of dicts with 'title', 'total_revenue', 'first_date', 'last_date'
+    """
+    return _rank_movies_df(read_revenues_df(file_path), top_n)
 
      
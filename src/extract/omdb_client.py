@@ -1,24 +1,74 @@
-import json
+import asyncio
+import atexit
 import logging
+import re
+import sqlite3
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 """
 OMDb API client with local caching and rate limiting.
 
 Handles:
 - API calls with retry logic
-- Local JSON cache to avoid redundant calls
+- Local SQLite cache to avoid redundant calls
 - Graceful handling of missing/unmatched movies
 """
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# sentinel distinguishing "no cache entry" from a cached None (not_found/error)
+_NOT_CACHED = object()
+
+# 4-digit year between 1900-2029, compiled once at import
+_YEAR_RE = re.compile(r'(?:19\d{2}|20[0-2]\d)')
+
+# HTTP statuses worth retrying (shared by the sync urllib3.Retry config
+# and the async retry loop)
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+@lru_cache(maxsize=4096)
+def _make_cache_key(title: str, year: int | None = None) -> str:
+    """Generate cache key from title and optional year (memoized - the
+    same titles recur across re-runs and retries)."""
+    normalized_title = title.lower().strip()
+    if year:
+        return f"{normalized_title}|{year}"
+    return normalized_title
+
+# (MovieMetadata field, OMDb response key) for the plain string fields;
+# 'N/A' and empty values are normalized to None in one place
+_STR_FIELDS = [
+    ('title', 'Title'),
+    ('year', 'Year'),
+    ('rated', 'Rated'),
+    ('released', 'Released'),
+    ('runtime', 'Runtime'),
+    ('genre', 'Genre'),
+    ('director', 'Director'),
+    ('actors', 'Actors'),
+    ('plot', 'Plot'),
+    ('language', 'Language'),
+    ('country', 'Country'),
+    ('awards', 'Awards'),
+    ('poster_url', 'Poster'),
+    ('imdb_id', 'imdbID'),
+    ('box_office', 'BoxOffice'),
+]
+
+@dataclass(slots=True)
 class MovieMetadata:
     """Enriched from OMDB"""
     title: str
@@ -48,6 +98,58 @@ class OMDbClientError(Exception):
     """Raised when API call fails after retries."""
     pass
 
+class TokenBucket:
+    """
+    Simple thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `refill_rate` per second up to `capacity`.
+    acquire() blocks (sleeps) until a token is available, so callers can
+    just wrap every outbound request with it.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, tokens: float) -> float:
+        """
+        Refill and try to consume `tokens`. Returns 0.0 on success, or the
+        seconds to wait before enough tokens will be available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.refill_rate,
+            )
+            self._last_refill = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            # not enough tokens - compute how long until there are
+            return (tokens - self._tokens) / self.refill_rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Async variant of acquire: yields to the event loop while waiting."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0.0:
+                return
+            await asyncio.sleep(wait)
+
 class OMDbClient:
     """
     Client for OMDb API with caching and retry logic.
@@ -64,45 +166,157 @@ class OMDbClient:
         api_key: str,
         cache_path: Path,
         requests_per_day: int = 1000,
+        requests_per_second: float = 5.0,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
+        flush_every: int = 50,
     ):
         self.api_key = api_key
         self.cache_path = cache_path
         self.requests_per_day = requests_per_day
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.flush_every = flush_every
 
-        self._cache: dict[str, dict] = {}
+        self._db: sqlite3.Connection | None = None
+        # already-constructed MovieMetadata by cache key, so repeat lookups
+        # skip the row fetch and the 19-kwarg dataclass rebuild; populated
+        # lazily as keys are actually queried
+        self._metadata_cache: dict[str, MovieMetadata] = {}
+        # cache key -> api_response_type, prefetched once at startup so hot
+        # lookups and misses never need a SELECT to learn a key's status
+        self._response_types: dict[str, str] = {}
+        self._response_type_counts: Counter = Counter()
         self._api_calls_made = 0
-        self._load_cache()
+        self._dirty_count = 0
+        # guards _db / _api_calls_made when get_movie is called from
+        # multiple worker threads
+        self._lock = threading.Lock()
+        self._rate_limiter = TokenBucket(
+            capacity=requests_per_second,
+            refill_rate=requests_per_second,
+        )
+        # pooled session: keep-alive avoids per-call TCP setup, and urllib3
+        # handles retries/backoff (including 429s) instead of a Python loop
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=retry_attempts,
+                backoff_factor=retry_delay,
+                status_forcelist=_RETRYABLE_STATUSES,
+                allowed_methods=['GET'],
+            ),
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # created lazily on first async call
+        self._async_client: httpx.AsyncClient | None = None
+        self._init_db()
+        # make sure buffered inserts reach disk even without the context manager
+        atexit.register(self.close)
 
-    def _load_cache(self) -> None:
-        """Load existing cache from disk."""
-        if self.cache_path.exists():
-            try:
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
-                    self._cache = json.load(f)
-                logger.info(f"Loaded {len(self._cache)} cached movies from {self.cache_path}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache: {e}. Starting fresh.")
-                self._cache = {}
-        else:
-            logger.info(f"No existing cache at {self.cache_path}")
-            self._cache = {}
-
-    def _save_cache(self) -> None:
-        """Persist cache to disk"""
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, 'w', encoding='utf-8') as f:
-            json.dump(self._cache, f, indent=2, ensure_ascii=False)
-
-    def _make_cache_key(self, title: str, year: int | None = None) -> str:
-        """Generate cache key from title and optional year"""
-        normalized_title = title.lower().strip()
-        if year:
-            return f"{normalized_title}|{year}"
-        return normalized_title
+    def __enter__(self) -> "OMDbClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _init_db(self) -> None:
+        """
+        Open the SQLite cache, creating it if needed.
+
+        SQLite gives us O(1) keyed lookups and single-row upserts instead of
+        re-reading / re-writing a whole JSON blob on every session and save.
+        WAL mode keeps concurrent reader threads from blocking on writes.
+        """
+        db_path = self.cache_path.with_suffix('.sqlite')
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "k TEXT PRIMARY KEY, response_type TEXT, v BLOB)"
+        )
+        self._db.commit()
+
+        cached = self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if cached == 0:
+            self._migrate_json_cache()
+
+        # prefetch the key -> response_type index in one scan
+        self._response_types = dict(
+            self._db.execute("SELECT k, response_type FROM cache").fetchall()
+        )
+        self._response_type_counts = Counter(self._response_types.values())
+
+        logger.info(f"Loaded {len(self._response_types)} cached movies from {db_path}")
+
+    def _migrate_json_cache(self) -> None:
+        """One-time import of a legacy JSON cache file into SQLite."""
+        if not self.cache_path.exists():
+            return
+        try:
+            legacy = orjson.loads(self.cache_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to read legacy JSON cache: {e}. Skipping migration.")
+            return
+
+        self._db.executemany(
+            "INSERT OR REPLACE INTO cache (k, response_type, v) VALUES (?, ?, ?)",
+            (
+                (key, entry.get('api_response_type'), orjson.dumps(entry))
+                for key, entry in legacy.items()
+            ),
+        )
+        self._db.commit()
+        logger.info(f"Migrated {len(legacy)} entries from legacy JSON cache {self.cache_path}")
+
+    def _cache_get(self, cache_key: str) -> dict | None:
+        """Fetch a cached entry, or None on miss. Caller must hold self._lock."""
+        row = self._db.execute(
+            "SELECT v FROM cache WHERE k = ?", (cache_key,)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def _cache_put(self, cache_key: str, entry: dict) -> None:
+        """
+        Upsert a single cache row, committing every `flush_every` inserts.
+        Caller must hold self._lock.
+        """
+        response_type = entry.get('api_response_type')
+        self._db.execute(
+            "INSERT OR REPLACE INTO cache (k, response_type, v) VALUES (?, ?, ?)",
+            (cache_key, response_type, orjson.dumps(entry)),
+        )
+        # keep the in-memory index and counters in step with the table
+        previous = self._response_types.get(cache_key)
+        if previous is not None:
+            self._response_type_counts[previous] -= 1
+        self._response_types[cache_key] = response_type
+        self._response_type_counts[response_type] += 1
+        self._dirty_count += 1
+        if self._dirty_count >= self.flush_every:
+            self._db.commit()
+            self._dirty_count = 0
+
+    def flush(self) -> None:
+        """Commit any buffered cache inserts to disk."""
+        with self._lock:
+            if self._dirty_count > 0:
+                self._db.commit()
+                self._dirty_count = 0
+
+    def close(self) -> None:
+        """Flush and close the cache database. Safe to call more than once."""
+        if self._db is None:
+            return
+        self.flush()
+        self._db.close()
+        self._db = None
 
     def get_movie(self, title: str, year: int | None = None) -> MovieMetadata | None:
         """
@@ -115,51 +329,113 @@ class OMDbClient:
         Returns:
             MovieMetadata if found, None if not found or error
         """
-        cache_key = self._make_cache_key(title, year)
+        cache_key = _make_cache_key(title, year)
+
+        # fast path: metadata already constructed for this key
+        metadata = self._metadata_cache.get(cache_key)
+        if metadata is not None:
+            return metadata
 
         # check cache first
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            logger.debug(f"Cache hit: {title}")
-            return self._dict_to_metadata(cached) if cached.get('api_response_type') == 'match' else None
+        cached = self._check_disk_cache(cache_key, title)
+        if cached is not _NOT_CACHED:
+            return cached
 
-        # call api
+        # call api (outside the lock so other threads aren't blocked on I/O)
         response_data = self._call_api(title, year)
 
+        return self._store_response(cache_key, title, response_data)
+
+    async def aget_movie(self, title: str, year: int | None = None) -> MovieMetadata | None:
+        """
+        Async variant of get_movie for use with enrich_movies_async.
+
+        Cache lookups stay synchronous (SQLite point reads are fast); only
+        the HTTP round trip is awaited, so hundreds of lookups can be in
+        flight on a single thread.
+        """
+        cache_key = _make_cache_key(title, year)
+
+        metadata = self._metadata_cache.get(cache_key)
+        if metadata is not None:
+            return metadata
+
+        cached = self._check_disk_cache(cache_key, title)
+        if cached is not _NOT_CACHED:
+            return cached
+
+        response_data = await self._acall_api(title, year)
+
+        return self._store_response(cache_key, title, response_data)
+
+    def _check_disk_cache(self, cache_key: str, title: str) -> "MovieMetadata | None | object":
+        """
+        Look up a key in the SQLite cache. Returns the (memoized) metadata
+        for a match, None for a cached not_found/error, or _NOT_CACHED.
+        """
+        response_type = self._response_types.get(cache_key)
+        if response_type is None:
+            return _NOT_CACHED
+
+        logger.debug(f"Cache hit: {cache_key}")
+        if response_type != 'match':
+            return None
+
+        with self._lock:
+            cached = self._cache_get(cache_key)
+        if cached is None:
+            # index said match but the row is gone; treat as a miss
+            return _NOT_CACHED
+
+        metadata = self._dict_to_metadata(cached)
+        self._metadata_cache[cache_key] = metadata
+        return metadata
+
+    def _store_response(self, cache_key: str, title: str, response_data: dict | None) -> MovieMetadata | None:
+        """Cache an API response (match / not_found / error) and return its metadata."""
         if response_data is None:
             # api error, cache as error and don't retry
-            self._cache[cache_key] = {
-                'title': title,
-                'api_response_type': 'error',
-                'enriched_at': datetime.utcnow().isoformat(),
-            }
-            self._save_cache()
+            with self._lock:
+                self._cache_put(cache_key, {
+                    'title': title,
+                    'api_response_type': 'error',
+                    'enriched_at': datetime.utcnow().isoformat(),
+                })
             return None
-        
+
         if response_data.get('Response') == 'False':
             # movie not found
             logger.info(f"Not found OMDb title: {title}")
-            self._cache[cache_key] = {
-                'title': title,
-                'api_response_type': 'not_found',
-                'enriched_at': datetime.utcnow().isoformat(),
-            }
-            self._save_cache()
+            with self._lock:
+                self._cache_put(cache_key, {
+                    'title': title,
+                    'api_response_type': 'not_found',
+                    'enriched_at': datetime.utcnow().isoformat(),
+                })
             return None
-        
+
         # success - parse and cache
         metadata = self._parse_response(response_data)
-        self._cache[cache_key] = asdict(metadata)
-        self._save_cache()
+        with self._lock:
+            self._cache_put(cache_key, asdict(metadata))
+        self._metadata_cache[cache_key] = metadata
 
         return metadata
 
-    def _call_api(self, title: str, year: int | None = None) -> dict | None:
-        """Make API calls with retry logic"""
+    def _build_params(self, title: str, year: int | None) -> dict | None:
+        """
+        Build query params, or None if the daily budget is spent.
 
-        if self._api_calls_made >= self.requests_per_day:
-            logger.warning(f"Daily API limit reached ({self.requests_per_day})")
-            return None
+        The call slot is reserved inside the locked check - incrementing
+        only after the response would let N in-flight workers overshoot
+        requests_per_day by up to N. Callers refund the slot via
+        _refund_call_slot when the call fails outright.
+        """
+        with self._lock:
+            if self._api_calls_made >= self.requests_per_day:
+                logger.warning(f"Daily API limit reached ({self.requests_per_day})")
+                return None
+            self._api_calls_made += 1
 
         params = {
             'apikey': self.api_key,
@@ -169,53 +445,106 @@ class OMDbClient:
         }
         if year:
             params['y'] = year
-        
+        return params
+
+    def _refund_call_slot(self) -> None:
+        """Return a call slot reserved by _build_params after a failed call."""
+        with self._lock:
+            self._api_calls_made -= 1
+
+    def _call_api(self, title: str, year: int | None = None) -> dict | None:
+        """Make API calls with retry logic"""
+
+        params = self._build_params(title, year)
+        if params is None:
+            return None
+
+        try:
+            self._rate_limiter.acquire()
+            response = self._session.get(
+                self.BASE_URL,
+                params=params,
+                timeout=10,
+            )
+
+            response.raise_for_status()
+            # bytes in, dict out - skips the str decode response.json() does
+            return orjson.loads(response.content)
+
+        except requests.exceptions.RequestException as e:
+            # urllib3's Retry already retried/backed off before raising
+            logger.error(f"Request failed after {self.retry_attempts} retries for {title}: {e}")
+            self._refund_call_slot()
+            return None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared httpx client (HTTP/2 multiplexed)."""
+        if self._async_client is None:
+            # no explicit transport: httpx ignores http2/limits when one is
+            # passed, and _acall_api's own loop already handles all retries
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10,
+                limits=httpx.Limits(max_connections=64),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client (call before the event loop exits)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def _acall_api(self, title: str, year: int | None = None) -> dict | None:
+        """Async counterpart of _call_api."""
+        params = self._build_params(title, year)
+        if params is None:
+            return None
+
+        # httpx's transport only retries connect errors, so retryable
+        # statuses (429/5xx) are handled here with backoff to match the
+        # sync path's urllib3.Retry - otherwise one transient 429 would
+        # get this movie cached as a permanent error
         for attempt in range(1, self.retry_attempts + 1):
             try:
-                response = requests.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=10,
-                )
-                self._api_calls_made += 1
+                await self._rate_limiter.acquire_async()
+                response = await self._get_async_client().get(self.BASE_URL, params=params)
+
+                if response.status_code in _RETRYABLE_STATUSES and attempt < self.retry_attempts:
+                    logger.warning(
+                        f"HTTP {response.status_code} on attempt {attempt}/{self.retry_attempts}: {title}"
+                    )
+                    await asyncio.sleep(self.retry_delay * attempt)
+                    continue
 
                 response.raise_for_status()
-                return response.json()
-            
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout on attempt {attempt}/{self.retry_attempts}: {title}")
-            except requests.exceptions.HTTPError as e:
-                logger.warning(f"HTTP error on attempt {attempt}/{self.retry_attempts}: {e}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request error on attempt {attempt}/{self.retry_attempts}: {e}")
+                # bytes in, dict out - skips the str decode response.json() does
+                return orjson.loads(response.content)
 
-            if attempt < self.retry_attempts:
-                time.sleep(self.retry_delay * attempt) # exponential backoff
+            except httpx.HTTPError as e:
+                logger.warning(f"Request error on attempt {attempt}/{self.retry_attempts}: {e}")
+                if attempt < self.retry_attempts:
+                    await asyncio.sleep(self.retry_delay * attempt)
 
         logger.error(f"All {self.retry_attempts} attempts failed for: {title}")
+        self._refund_call_slot()
         return None
 
     def _parse_response(self, data: dict) -> MovieMetadata:
         """Parse OMDb API response into MovieMetadata."""
+        kwargs = {}
+        for dst, src in _STR_FIELDS:
+            v = data.get(src)
+            kwargs[dst] = v if v and v != 'N/A' else None
+
+        # title is required on MovieMetadata
+        kwargs['title'] = kwargs['title'] or ''
+
         return MovieMetadata(
-            title=data.get('Title', ''),
-            year=data.get('Year'),
-            rated=data.get('Rated') if data.get('Rated') != 'N/A' else None,
-            released=data.get('Released') if data.get('Released') != 'N/A' else None,
-            runtime=data.get('Runtime') if data.get('Runtime') != 'N/A' else None,
-            genre=data.get('Genre') if data.get('Genre') != 'N/A' else None,
-            director=data.get('Director') if data.get('Director') != 'N/A' else None,
-            actors=data.get('Actors') if data.get('Actors') != 'N/A' else None,
-            plot=data.get('Plot') if data.get('Plot') != 'N/A' else None,
-            language=data.get('Language') if data.get('Language') != 'N/A' else None,
-            country=data.get('Country') if data.get('Country') != 'N/A' else None,
-            awards=data.get('Awards') if data.get('Awards') != 'N/A' else None,
-            poster_url=data.get('Poster') if data.get('Poster') != 'N/A' else None,
+            **kwargs,
             metascore=self._parse_int(data.get('Metascore')),
             imdb_rating=self._parse_float(data.get('imdbRating')),
             imdb_votes=self._parse_int(data.get('imdbVotes', '').replace(',', '')),
-            imdb_id=data.get('imdbID'),
-            box_office=data.get('BoxOffice') if data.get('BoxOffice') != 'N/A' else None,
             enriched_at=datetime.utcnow().isoformat(),
             api_response_type='match',
         )
@@ -245,16 +574,15 @@ class OMDbClient:
             return None
 
     def get_stats(self) -> dict:
-        """Return cache and API usage statistics."""
-        cached_matches = sum(1 for v in self._cache.values() if v.get('api_response_type') == 'match')
-        cached_not_found = sum(1 for v in self._cache.values() if v.get('api_response_type') == 'not_found')
-        cached_errors = sum(1 for v in self._cache.values() if v.get('api_response_type') == 'error')
-        
+        """Return cache and API usage statistics (O(1), from live counters)."""
+        with self._lock:
+            counts = dict(self._response_type_counts)
+
         return {
-            'total_cached': len(self._cache),
-            'cached_matches': cached_matches,
-            'cached_not_found': cached_not_found,
-            'cached_errors': cached_errors,
+            'total_cached': sum(counts.values()),
+            'cached_matches': counts.get('match', 0),
+            'cached_not_found': counts.get('not_found', 0),
+            'cached_errors': counts.get('error', 0),
             'api_calls_this_session': self._api_calls_made,
             'api_calls_remaining': self.requests_per_day - self._api_calls_made,
         }
@@ -263,39 +591,100 @@ def enrich_movies(
     client: OMDbClient,
     movies: list[dict],
     progress_interval: int = 50,
+    max_workers: int = 16,
 ) -> list[MovieMetadata]:
     """
     Enrich a list of movies using the OMDb client.
-    
+
+    The work is I/O-bound (each API call blocks on the network), so the
+    lookups run in a thread pool. The client's token bucket keeps us under
+    OMDb's per-second cap regardless of worker count.
+
     Args:
         client: OMDbClient instance
         movies: List of dicts with at least 'title' key (from csv_parser.get_unique_movies_by_revenue)
         progress_interval: Log progress every N movies
-        
+        max_workers: Number of concurrent lookup threads
+
     Returns:
         List of MovieMetadata for successfully enriched movies
     """
     enriched = []
-    
-    for i, movie in enumerate(movies, start=1):
+
+    def _lookup(movie: dict) -> MovieMetadata | None:
         title = movie['title']
-        
         # Try to extract year from title if present (e.g., "The Polar Express2017 IMAX Release")
         year = _extract_year_from_title(title)
-        
-        metadata = client.get_movie(title, year=year)
-        
-        if metadata:
-            enriched.append(metadata)
-        
-        if i % progress_interval == 0:
-            stats = client.get_stats()
-            logger.info(
-                f"Progress: {i}/{len(movies)} | "
-                f"Enriched: {len(enriched)} | "
-                f"API calls remaining: {stats['api_calls_remaining']}"
-            )
-    
+        return client.get_movie(title, year=year)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_lookup, movie) for movie in movies]
+
+        for i, future in enumerate(as_completed(futures), start=1):
+            metadata = future.result()
+
+            if metadata:
+                enriched.append(metadata)
+
+            if i % progress_interval == 0:
+                stats = client.get_stats()
+                logger.info(
+                    f"Progress: {i}/{len(movies)} | "
+                    f"Enriched: {len(enriched)} | "
+                    f"API calls remaining: {stats['api_calls_remaining']}"
+                )
+
+    logger.info(f"Enrichment complete: {len(enriched)}/{len(movies)} movies matched")
+    return enriched
+
+
+async def enrich_movies_async(
+    client: OMDbClient,
+    movies: list[dict],
+    progress_interval: int = 50,
+    max_concurrency: int = 32,
+) -> list[MovieMetadata]:
+    """
+    Async variant of enrich_movies: all lookups share one event loop and
+    one HTTP/2 connection pool instead of a thread per in-flight request.
+
+    Args:
+        client: OMDbClient instance
+        movies: List of dicts with at least 'title' key
+        progress_interval: Log progress every N movies
+        max_concurrency: Cap on simultaneous in-flight lookups
+
+    Returns:
+        List of MovieMetadata for successfully enriched movies
+    """
+    enriched = []
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _lookup(movie: dict) -> MovieMetadata | None:
+        async with semaphore:
+            title = movie['title']
+            year = _extract_year_from_title(title)
+            return await client.aget_movie(title, year=year)
+
+    try:
+        tasks = [asyncio.ensure_future(_lookup(movie)) for movie in movies]
+
+        for i, task in enumerate(asyncio.as_completed(tasks), start=1):
+            metadata = await task
+
+            if metadata:
+                enriched.append(metadata)
+
+            if i % progress_interval == 0:
+                stats = client.get_stats()
+                logger.info(
+                    f"Progress: {i}/{len(movies)} | "
+                    f"Enriched: {len(enriched)} | "
+                    f"API calls remaining: {stats['api_calls_remaining']}"
+                )
+    finally:
+        await client.aclose()
+
     logger.info(f"Enrichment complete: {len(enriched)}/{len(movies)} movies matched")
     return enriched
 
@@ -303,12 +692,8 @@ def enrich_movies(
 def _extract_year_from_title(title: str) -> int | None:
     """
     Attempt to extract a 4-digit year from title.
-    
+
     Handles cases like "The Polar Express2017 IMAX Release"
     """
-    import re
-    # Look for 4-digit year between 1900-2030
-    match = re.search(r'(19\d{2}|20[0-2]\d)', title)
-    if match:
-        return int(match.group(1))
-    return None
\ No newline at end of file
+    match = _YEAR_RE.search(title)
+    return int(match.group()) if match else None
\ No newline at end of file
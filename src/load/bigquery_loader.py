@@ -1,13 +1,22 @@
 import logging
-from dataclasses import asdict
-from decimal import Decimal
+import tempfile
+from dataclasses import fields
 from pathlib import Path
+from typing import Iterable
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery
-from google.cloud.bigquery import LoadJobConfig, WriteDisposition, SchemaField
+from google.cloud.bigquery import LoadJobConfig, SourceFormat, WriteDisposition, SchemaField
+
+from src.extract.csv_parser import RevenueRecord
+from src.extract.omdb_client import MovieMetadata
 
 logger = logging.getLogger(__name__)
 
+# column order for stg_movies_enriched, derived from the dataclass
+_MOVIE_FIELDS = [f.name for f in fields(MovieMetadata)]
+
 class BigQueryLoader:
     """
     Loader for BigQuery staging tables.
@@ -26,88 +35,151 @@ class BigQueryLoader:
         self.revenues_table = f"{project_id}.{dataset}.stg_revenues_raw"
         self.movies_table = f"{project_id}.{dataset}.stg_movies_enriched"
 
-    def load_revenues(self, records: list, write_disposition: WriteDisposition = WriteDisposition.WRITE_TRUNCATE,) -> int:
+    REVENUE_COLUMNS = [
+        'id', 'date', 'title', 'revenue', 'theaters', 'distributor',
+        'has_valid_theaters', 'has_valid_distributor',
+    ]
+
+    REVENUE_ARROW_SCHEMA = pa.schema([
+        ('id', pa.string()),
+        ('date', pa.date32()),
+        ('title', pa.string()),
+        ('revenue', pa.float64()),
+        ('theaters', pa.int64()),
+        ('distributor', pa.string()),
+        ('has_valid_theaters', pa.bool_()),
+        ('has_valid_distributor', pa.bool_()),
+    ])
+
+    # rows per Parquet row group / record batch when streaming; peak memory
+    # while loading is bounded by one batch, not the full dataset
+    PARQUET_BATCH_SIZE = 20_000
+
+    def submit_revenues(self, records: "pd.DataFrame | Iterable[RevenueRecord]", write_disposition: WriteDisposition = WriteDisposition.WRITE_TRUNCATE,) -> bigquery.LoadJob:
         """
-        Load revenue records to stg_revenues_raw.
-        
+        Submit a load job for stg_revenues_raw without waiting on it.
+
+        The records are written to a local Parquet file in chunks and loaded
+        with load_table_from_file, so BigQuery never sees an intermediate
+        all-in-memory DataFrame and pyarrow writes columnar bytes directly.
+        Returning the LoadJob lets callers run this concurrently with other
+        loads and await them together.
+
         Args:
-            records: List of RevenueRecord objects from csv_parser
+            records: DataFrame from csv_parser.read_revenues_df, or any
+                iterable of RevenueRecord objects - a lazy generator such as
+                parse_revenues_csv(...) is consumed batch by batch and never
+                materialized in full
             write_disposition: WRITE_TRUNCATE (replace) or WRITE_APPEND
-            
+
         Returns:
-            Number of rows loaded
-        """ 
-        logger.info(f"Preparing {len(records)} revenue records for BigQuery")
-        
-        # convert to list of dicts for DataFrame
-        rows = []
-        for record in records:
-            rows.append({
-                'id': record.id,
-                'date': record.date,
-                'title': record.title,
-                'revenue': float(record.revenue),
-                'theaters': record.theaters,
-                'distributor': record.distributor,
-                'has_valid_theaters': record.has_valid_theaters,
-                'has_valid_distributor': record.has_valid_distributor,
-            })
+            The submitted LoadJob
+        """
+        logger.info("Writing revenue records to Parquet for BigQuery load")
 
-        df = pd.DataFrame(rows)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_path = Path(tmp_dir) / 'revenues.parquet'
 
-        # define schema explicitly
-        schema = [
-            SchemaField("id", "STRING", mode="REQUIRED"),
-            SchemaField("date", "DATE", mode="REQUIRED"),
-            SchemaField("title", "STRING", mode="REQUIRED"),
-            SchemaField("revenue", "FLOAT64", mode="REQUIRED"),
-            SchemaField("theaters", "INT64", mode="NULLABLE"),
-            SchemaField("distributor", "STRING", mode="NULLABLE"),
-            SchemaField("has_valid_theaters", "BOOL", mode="REQUIRED"),
-            SchemaField("has_valid_distributor", "BOOL", mode="REQUIRED"),
-        ]
+            with pq.ParquetWriter(parquet_path, self.REVENUE_ARROW_SCHEMA) as writer:
+                if isinstance(records, pd.DataFrame):
+                    self._write_revenue_df(writer, records)
+                else:
+                    self._write_revenue_records(writer, records)
 
-        job_config = LoadJobConfig(
-            schema=schema,
-            write_disposition=write_disposition,
-        )
+            # define schema explicitly
+            schema = [
+                SchemaField("id", "STRING", mode="REQUIRED"),
+                SchemaField("date", "DATE", mode="REQUIRED"),
+                SchemaField("title", "STRING", mode="REQUIRED"),
+                SchemaField("revenue", "FLOAT64", mode="REQUIRED"),
+                SchemaField("theaters", "INT64", mode="NULLABLE"),
+                SchemaField("distributor", "STRING", mode="NULLABLE"),
+                SchemaField("has_valid_theaters", "BOOL", mode="REQUIRED"),
+                SchemaField("has_valid_distributor", "BOOL", mode="REQUIRED"),
+            ]
 
-        logger.info(f"Loading to {self.revenues_table}")
+            job_config = LoadJobConfig(
+                source_format=SourceFormat.PARQUET,
+                schema=schema,
+                write_disposition=write_disposition,
+            )
 
-        job = self.client.load_table_from_dataframe(
-            df,
-            self.revenues_table,
-            job_config=job_config,
-        )
+            logger.info(f"Loading to {self.revenues_table}")
 
+            with open(parquet_path, 'rb') as src:
+                job = self.client.load_table_from_file(
+                    src,
+                    self.revenues_table,
+                    job_config=job_config,
+                )
+
+        return job
+
+    def load_revenues(self, records, write_disposition: WriteDisposition = WriteDisposition.WRITE_TRUNCATE,) -> int:
+        """
+        Load revenue records to stg_revenues_raw and wait for completion.
+
+        Returns:
+            Number of rows loaded
+        """
+        job = self.submit_revenues(records, write_disposition)
         job.result() # wait for completion
 
         table = self.client.get_table(self.revenues_table)
-        logger.info(f"Loaded {table.num_rows} rows to {self.movies_table}")
+        logger.info(f"Loaded {table.num_rows} rows to {self.revenues_table}")
 
         return table.num_rows
 
-    def load_movies(
+    def _write_revenue_df(self, writer: pq.ParquetWriter, df: pd.DataFrame) -> None:
+        """Write a revenues DataFrame to Parquet in fixed-size chunks."""
+        for start in range(0, len(df), self.PARQUET_BATCH_SIZE):
+            chunk = df.iloc[start:start + self.PARQUET_BATCH_SIZE][self.REVENUE_COLUMNS]
+            writer.write_table(pa.Table.from_pandas(
+                chunk,
+                schema=self.REVENUE_ARROW_SCHEMA,
+                preserve_index=False,
+            ))
+
+    def _write_revenue_records(self, writer: pq.ParquetWriter, records: Iterable[RevenueRecord]) -> None:
+        """Write an iterable of RevenueRecords to Parquet in batches."""
+        batch: list[dict] = []
+        for record in records:
+            batch.append({
+                'id': record.id,
+                'date': record.date,
+                'title': record.title,
+                'revenue': record.revenue,
+                'theaters': record.theaters,
+                'distributor': record.distributor,
+                'has_valid_theaters': record.has_valid_theaters,
+                'has_valid_distributor': record.has_valid_distributor,
+            })
+            if len(batch) >= self.PARQUET_BATCH_SIZE:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=self.REVENUE_ARROW_SCHEMA))
+                batch.clear()
+
+        if batch:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=self.REVENUE_ARROW_SCHEMA))
+
+    def submit_movies(
         self,
         movies: list,
         write_disposition: WriteDisposition = WriteDisposition.WRITE_TRUNCATE,
-    ) -> int:
+    ) -> bigquery.LoadJob:
         """
-        Load movie metadata to stg_movies_enriched.
+        Submit a load job for stg_movies_enriched without waiting on it.
         """
         logger.info(f"Preparing {len(movies)} movie records for BigQuery")
 
-        # convert dataclass object to dicts
-        rows = []
-        for movie in movies:
-            if hasattr(movie, '__dataclass_fields__'):
-                row = asdict(movie)
-            else:
-                row = movie  # already a dict from cache
-            rows.append(row)
-
-        # Everything below should be OUTSIDE the for loop (unindented)
-        df = pd.DataFrame(rows)
+        # read attributes directly instead of asdict() (which deep-copies
+        # every field) and let pandas allocate the columns once
+        rows_iter = (
+            tuple(getattr(movie, name) for name in _MOVIE_FIELDS)
+            if hasattr(movie, '__dataclass_fields__')
+            else tuple(movie.get(name) for name in _MOVIE_FIELDS)  # dict from cache
+            for movie in movies
+        )
+        df = pd.DataFrame.from_records(rows_iter, columns=_MOVIE_FIELDS)
 
         # define schema
         schema = [
@@ -140,12 +212,21 @@ class BigQueryLoader:
 
         logger.info(f"Loading to {self.movies_table}")
 
-        job = self.client.load_table_from_dataframe(
+        return self.client.load_table_from_dataframe(
             df,
             self.movies_table,
             job_config=job_config,
         )
 
+    def load_movies(
+        self,
+        movies: list,
+        write_disposition: WriteDisposition = WriteDisposition.WRITE_TRUNCATE,
+    ) -> int:
+        """
+        Load movie metadata to stg_movies_enriched and wait for completion.
+        """
+        job = self.submit_movies(movies, write_disposition)
         job.result()  # wait for completion
 
         table = self.client.get_table(self.movies_table)
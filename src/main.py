@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -39,8 +40,8 @@ def main():
         BQ_DATASET,
         BQ_LOCATION,
     )
-    from src.extract.csv_parser import parse_revenues_csv, get_unique_movies_by_revenue
-    from src.extract.omdb_client import OMDbClient, enrich_movies
+    from src.extract.csv_parser import extract_all_df
+    from src.extract.omdb_client import OMDbClient, enrich_movies_async
     from src.load.bigquery_loader import BigQueryLoader
     
     logger.info("="*60)
@@ -54,17 +55,13 @@ def main():
         logger.error(f"CSV file not found: {REVENUES_CSV_PATH}")
         sys.exit(1)
 
-    # parse all records into memory (good enough for a take home assignment, 340k rows only)
-    revenue_records = list(parse_revenues_csv(REVENUES_CSV_PATH))
-    logger.info(f"Parsed {len(revenue_records)} revenue records")
-
-    # step 2: get top movies for enrichment
-    logger.info(f"Identifying top {TOP_N_MOVIES_TO_ENRICH} movies by revenue")
-
-    top_movies = get_unique_movies_by_revenue(
+    # step 1+2: single pandas read of the CSV yields both the revenue
+    # DataFrame and the top movies for enrichment (no second read)
+    revenue_df, top_movies = extract_all_df(
         REVENUES_CSV_PATH,
         top_n=TOP_N_MOVIES_TO_ENRICH
     )
+    logger.info(f"Parsed {len(revenue_df)} revenue records")
     logger.info(f"Top movie: {top_movies[0]['title']} (${top_movies[0]['total_revenue']:,.0f})")
 
     # step 3: enrich via omdb api
@@ -74,14 +71,16 @@ def main():
         logger.error("OMDB_API_KEY not set in environment")
         sys.exit(1)
 
-    client = OMDbClient(
+    # context manager flushes any buffered cache writes on exit
+    with OMDbClient(
         api_key=OMDB_API_KEY,
         cache_path=OMDB_CACHE_PATH,
-    )
-
-    enriched_movies = enrich_movies(client, top_movies, progress_interval=100)
+    ) as client:
+        enriched_movies = asyncio.run(
+            enrich_movies_async(client, top_movies, progress_interval=100)
+        )
 
-    stats = client.get_stats()
+        stats = client.get_stats()
     logger.info(f"Enrichment stats: {stats}")
     
     # step 4: load into BigQuery
@@ -93,13 +92,15 @@ def main():
         location=BQ_LOCATION,
     )
 
-    # load revenues
-    revenues_loaded = loader.load_revenues(revenue_records)
-    logger.info(f"Loaded {revenues_loaded} revenue records")
+    # the two tables are independent, so submit both load jobs first and
+    # wait on them together instead of loading sequentially
+    revenues_job = loader.submit_revenues(revenue_df)
+    movies_job = loader.submit_movies(enriched_movies)
 
-    # load enriched movies
-    movies_loaded = loader.load_movies(enriched_movies)
-    logger.info(f"Loaded {movies_loaded} movie records")
+    revenues_job.result()
+    movies_job.result()
+    logger.info(f"Loaded {revenues_job.output_rows} revenue records")
+    logger.info(f"Loaded {movies_job.output_rows} movie records")
 
     # step 5: validate
     logger.info("Validating loaded data")